@@ -2,23 +2,62 @@
 This file contains common functions for the wheecious.kener collection
 """
 
+from urllib.parse import urlparse
+from urllib.request import getproxies, proxy_bypass
+
 from ansible.module_utils.urls import fetch_url
-import json
+
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+# Same default as fetch_url
+REQUEST_TIMEOUT = 10
 
 def make_api_request(module, method, endpoint, data=None):
     """Make HTTP request to Kener API"""
-    api_url = module.params['api_url'].rstrip('/')
-    api_key = module.params['api_key']
-
-    url = f'{api_url}{endpoint}'
+    if not hasattr(module, '_kener_headers'):
+        module._kener_base = module.params['api_url'].rstrip('/')
+        module._kener_headers = {
+            'Authorization': f'Bearer {module.params["api_key"]}',
+            'Content-Type': 'application/json'}
 
-    headers ={
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'}
+    url = f'{module._kener_base}{endpoint}'
+    headers = module._kener_headers
     body = None
 
     if data:
-        body = json.dumps(data)
+        body = json_dumps(data)
+
+    if HAS_URLLIB3:
+        session = _get_session(module)
+        try:
+            response = session.request(
+                method, url, body=body, headers=headers,
+                timeout=urllib3.Timeout(REQUEST_TIMEOUT),
+                retries=False, redirect=False)
+        except urllib3.exceptions.HTTPError as e:
+            module.fail_json(msg=f'API request failed: {e}')
+
+        if response.status >= 400:
+            module.fail_json(msg=f'API error: {response.status}')
+        if response.status >= 300:
+            module.fail_json(
+                msg=f'API error: unexpected redirect ({response.status}) '
+                    f'to {response.headers.get("Location")}; check api_url')
+
+        return _parse_body(response.data)
 
     response, info = fetch_url(
         module, url, data=body, headers=headers, method=method)
@@ -27,15 +66,43 @@ def make_api_request(module, method, endpoint, data=None):
         module.fail_json(msg=f'API error: {info["status"]}')
 
     if response:
-        return json.loads(response.read())
+        return _parse_body(response.read())
+    return None
+
+def _parse_body(data):
+    """Decode a raw response body, passing the bytes to the parser as-is"""
+    if not data:
+        return None
+    return json_loads(data)
+
+def _get_session(module):
+    """Return a connection pool reused by every request of the task"""
+    session = getattr(module, '_kener_session', None)
+    if session is None:
+        cert_reqs = 'CERT_REQUIRED'
+        if not module.params['validate_certs']:
+            cert_reqs = 'CERT_NONE'
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        pool_kw = dict(cert_reqs=cert_reqs, maxsize=4, block=False)
+        proxy = _get_proxy(module.params['api_url'])
+        if proxy:
+            session = urllib3.ProxyManager(proxy, **pool_kw)
+        else:
+            session = urllib3.PoolManager(**pool_kw)
+        module._kener_session = session
+    return session
+
+def _get_proxy(url):
+    """Return the proxy from the environment to use for url, if any"""
+    parsed = urlparse(url)
+    proxy = getproxies().get(parsed.scheme)
+    if proxy and not proxy_bypass(parsed.hostname or ''):
+        return proxy
     return None
 
 def is_changed(params, existing_params):
-    for param in params:
-        existing_param = existing_params[param]
-        if param == 'type_data':
-            # TODO parse type_data even if null
-            existing_param = json.loads(existing_params['type_data'])
-        if params[param] != existing_param:
-            return True
-    return False
\ No newline at end of file
+    normalized = {k: existing_params.get(k) for k in params}
+    if 'type_data' in normalized:
+        type_data = normalized['type_data']
+        normalized['type_data'] = json_loads(type_data) if type_data else {}
+    return params != normalized
\ No newline at end of file
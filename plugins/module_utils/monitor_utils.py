@@ -2,12 +2,20 @@
 This file contains functions for the wheecious.kener.monitor module
 """
 
+from urllib.parse import quote
+
+from ansible_collections.wheecious.kener.plugins.module_utils.common import (
+    make_api_request
+)
+
 required_fields = {
     'API': ['url', 'method', 'timeout'],
     'SSL': ['host', 'port', 'degradedRemainingHours', 'downRemainingHours'],
-    'DNS': ['lookupRecord', 'nameServer', 'matchType', 'values']
+    'DNS': ['host', 'lookupRecord', 'nameServer', 'matchType', 'values']
 }
 
+required_keys = {k: frozenset(v) for k, v in required_fields.items()}
+
 def build_payload(module):
     params = module.params
     monitor_type = params['monitor_type']
@@ -20,12 +28,31 @@ def build_payload(module):
         'monitor_type': params['monitor_type'],
     }
     if params['monitor_type'] == 'TCP' or params['monitor_type'] == 'PING':
+        if not params['hosts']:
+            module.fail_json(msg=f'hosts is required for {monitor_type}')
         payload['type_data'] = {
             'hosts': params['hosts']
         }
-    elif monitor_type in required_fields:
-        for field in required_fields[monitor_type]:
-            if not params['monitor'].get(field):
-                module.fail_json(msg=f'{field} is required for {monitor_type}')
-        payload['type_data'] = params['monitor']
-    return payload
\ No newline at end of file
+    elif monitor_type in required_keys:
+        required = required_keys[monitor_type]
+        monitor = params['monitor']
+        missing = required - {k for k, v in monitor.items() if v}
+        if missing:
+            module.fail_json(
+                msg=f'missing required fields for {monitor_type}: {", ".join(sorted(missing))}')
+        payload['type_data'] = {k: monitor[k] for k in required_fields[monitor_type]}
+    return payload
+
+def get_monitor(module, tag):
+    """Return the monitor with the given tag, or None if there is none.
+
+    Kener has no upsert-by-tag endpoint, so this lookup is the only request
+    made when the monitor is already up to date.
+    """
+    existing = make_api_request(
+        module, 'GET', f'/api/monitor?tag={quote(tag, safe="")}')
+    if isinstance(existing, dict):
+        return existing
+    if existing:
+        return existing[0]
+    return None
\ No newline at end of file
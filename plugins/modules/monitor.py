@@ -178,6 +178,8 @@ options:
                 elements: str
 requirements:
     - Kener API v3.2+
+    - orjson (optional, faster JSON encoding/decoding)
+    - urllib3 (optional, reuses one connection for all API calls of a task)
 author:
     - wheecious (@wheecious)
 '''
@@ -192,7 +194,6 @@ EXAMPLES = r'''
         api_key: "supersecret_api_key"
         tag: 'ping-prod-DO-NOT-DELETE'
         state: 'absent'
-        hosts: [] # need this for now; gotta get rid of it in future versions
 
     - name: API monitor
       wheecious.kener.monitor:
@@ -276,7 +277,7 @@ from ansible_collections.wheecious.kener.plugins.module_utils.common import (
 
 from ansible_collections.wheecious.kener.plugins.module_utils.monitor_utils import (
     build_payload,
-    required_fields
+    get_monitor
 )
 
 def main():
@@ -336,25 +337,18 @@ def main():
                 )
             )
         ),
-        required_if=[
-            ('monitor_type', 'TCP', ['hosts']),
-            ('monitor_type', 'PING', ['hosts']),
-            ('monitor_type', 'API', ['monitor']),
-            ('monitor_type', 'SSL', ['monitor']),
-            ('monitor_type', 'DNS', ['monitor']),
-        ],
         supports_check_mode=False
     )
 
     state = module.params['state']
-    payload = build_payload(module)
     if state == 'present':
-        existing = make_api_request(module, 'GET', f'/api/monitor?tag={payload["tag"]}')
+        payload = build_payload(module)
+        existing = get_monitor(module, payload['tag'])
         if existing:
-            if is_changed(payload, existing[0]):
-                payload['id'] = existing[0]["id"]
+            if is_changed(payload, existing):
+                payload['id'] = existing["id"]
                 result = make_api_request(
-                    module, 'PUT', f'/api/monitor/{existing[0]["id"]}',
+                    module, 'PUT', f'/api/monitor/{existing["id"]}',
                     data=payload)
                 module.exit_json(changed=True)
             else:
@@ -364,12 +358,13 @@ def main():
                 module, 'POST', '/api/monitor', data=payload)
             module.exit_json(changed=True, msg=result)
     elif state == "absent":
-        existing = make_api_request(module, 'GET', f'/api/monitor?tag={payload["tag"]}')
+        tag = module.params['tag']
+        existing = get_monitor(module, tag)
         if existing:
-            make_api_request(module, 'DELETE', f'/api/monitor/{existing[0]["id"]}')
-            module.exit_json(changed=True, msg=f'Monitor {payload["tag"]} was removed')
+            make_api_request(module, 'DELETE', f'/api/monitor/{existing["id"]}')
+            module.exit_json(changed=True, msg=f'Monitor {tag} was removed')
         else:
-            module.exit_json(changed=False, msg=f'No monitor {payload["tag"]} found')
+            module.exit_json(changed=False, msg=f'No monitor {tag} found')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file